@@ -12,63 +12,67 @@ Example:
     >>> asyncio.run(main())
 """
 
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
-from .client import FirecrawlClient
 from .exceptions import (
     AuthenticationError,
     FirecrawlError,
     PaymentRequiredError,
     RateLimitError,
 )
-from .models import (
-    ActiveCrawl,
-    ActiveCrawlsResponse,
-    AgentJobResponse,
-    AgentRequest,
-    AgentStatusResponse,
-    BatchScrapeJobResponse,
-    BatchScrapeRequest,
-    BatchScrapeStatusResponse,
-    CancelResponse,
-    ChangeTrackingData,
-    CrawlJobResponse,
-    CrawlParamsPreviewData,
-    CrawlParamsPreviewRequest,
-    CrawlParamsPreviewResponse,
-    CrawlRequest,
-    CrawlStatusResponse,
-    CreditUsageData,
-    CreditUsageHistoricalResponse,
-    CreditUsagePeriod,
-    CreditUsageResponse,
-    ExtractJobResponse,
-    ExtractRequest,
-    ExtractStatusResponse,
-    JobError,
-    JobErrorsResponse,
-    Link,
-    LocationSettings,
-    MapRequest,
-    MapResponse,
-    QueueStatusResponse,
-    ScrapeData,
-    ScrapeMetadata,
-    ScrapeRequest,
-    ScrapeResponse,
-    SearchData,
-    SearchImageResult,
-    SearchNewsResult,
-    SearchRequest,
-    SearchResponse,
-    SearchWebResult,
-    TokenUsageData,
-    TokenUsageHistoricalResponse,
-    TokenUsagePeriod,
-    TokenUsageResponse,
-)
 from .utils import load_api_key
 
+if TYPE_CHECKING:
+    from .client import FirecrawlClient
+    from .models import (
+        ActiveCrawl,
+        ActiveCrawlsResponse,
+        AgentJobResponse,
+        AgentRequest,
+        AgentStatusResponse,
+        BatchScrapeJobResponse,
+        BatchScrapeRequest,
+        BatchScrapeStatusResponse,
+        CancelResponse,
+        ChangeTrackingData,
+        CrawlJobResponse,
+        CrawlParamsPreviewData,
+        CrawlParamsPreviewRequest,
+        CrawlParamsPreviewResponse,
+        CrawlRequest,
+        CrawlStatusResponse,
+        CreditUsageData,
+        CreditUsageHistoricalResponse,
+        CreditUsagePeriod,
+        CreditUsageResponse,
+        ExtractJobResponse,
+        ExtractRequest,
+        ExtractStatusResponse,
+        JobError,
+        JobErrorsResponse,
+        Link,
+        LocationSettings,
+        MapRequest,
+        MapResponse,
+        QueueStatusResponse,
+        ScrapeData,
+        ScrapeMetadata,
+        ScrapeRequest,
+        ScrapeResponse,
+        SearchData,
+        SearchImageResult,
+        SearchNewsResult,
+        SearchRequest,
+        SearchResponse,
+        SearchWebResult,
+        TokenUsageData,
+        TokenUsageHistoricalResponse,
+        TokenUsagePeriod,
+        TokenUsageResponse,
+    )
+
 try:
     __version__ = version("firecrawl-wb")
 except PackageNotFoundError:  # pragma: no cover
@@ -125,3 +129,19 @@ __all__ = [
     "TokenUsageResponse",
     "load_api_key",
 ]
+
+
+# The client (httpx) and models (~50 pydantic schemas) are imported on first
+# attribute access, keeping ``import firecrawl`` cheap for callers that only
+# need a subset. Every public name not imported above lives in ``.models``.
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = ".client" if name == "FirecrawlClient" else ".models"
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -2,9 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any, TypeVar
+import asyncio
+import os
+import random
+import time
+import urllib.request
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import nullcontext
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, BinaryIO, TypeVar, cast
+from urllib.parse import urlsplit
 
 import httpx
+import pydantic_core
 from pydantic import BaseModel
 
 from .exceptions import (
@@ -47,37 +61,159 @@ from .models import (
 __all__ = ["FirecrawlClient"]
 
 T = TypeVar("T", bound=BaseModel)
+_CacheKey = tuple[str, frozenset[tuple[str, Any]]]
+_Decoder = Callable[[bytes], Any]
 API_BASE = "https://api.firecrawl.dev/v2"
+BASE_HEADERS = {"Content-Type": "application/json"}
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+# Responses in these states are never cached: polling them must hit the server.
+IN_PROGRESS_STATUSES = frozenset({"scraping", "processing"})
+# Status responses whose fields are all scalars or raw ``list[dict]`` pages, so
+# ``model_construct`` builds the same object as validation would.
+TRUSTED_TYPES: frozenset[type[BaseModel]] = frozenset(
+    {CrawlStatusResponse, BatchScrapeStatusResponse}
+)
+# Bound pydantic-core validators for every response type, compiled at import.
+RESPONSE_DECODERS: dict[type[BaseModel], _Decoder] = {
+    t: t.__pydantic_validator__.validate_json
+    for t in (
+        ActiveCrawlsResponse,
+        AgentJobResponse,
+        AgentStatusResponse,
+        BatchScrapeJobResponse,
+        BatchScrapeStatusResponse,
+        CancelResponse,
+        CrawlJobResponse,
+        CrawlParamsPreviewResponse,
+        CrawlStatusResponse,
+        CreditUsageHistoricalResponse,
+        CreditUsageResponse,
+        ExtractJobResponse,
+        ExtractStatusResponse,
+        JobErrorsResponse,
+        MapResponse,
+        QueueStatusResponse,
+        ScrapeResponse,
+        SearchResponse,
+        TokenUsageHistoricalResponse,
+        TokenUsageResponse,
+    )
+}
+RETRY_STATUSES = frozenset({502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
+RETRY_BACKOFF = 0.5
+MAX_RETRY_DELAY = 60.0
+# Default cap on concurrent scrapes of one host in scrape_many, so a list of
+# same-site URLs doesn't trip the target's anti-bot or rate limiting.
+MAX_PER_HOST = 4
+# crawl_stream fsyncs its checkpoint file after this many pages (and at the
+# end), trading a few re-fetched pages after a power loss for fewer syncs.
+CHECKPOINT_SYNC_EVERY = 10
+# Transport-level retries only cover failures to establish a connection, so
+# they are safe for every method, unlike the response-level retries above.
+CONNECT_RETRIES = 3
+# A short connect timeout lets the connect retries kick in quickly; reads stay
+# long because scrape and extract calls can take minutes server-side.
+TIMEOUT = httpx.Timeout(90.0, connect=10.0, read=300.0)
+# All traffic goes to one host, so HTTP/2 multiplexes concurrent requests over
+# a single connection; the limits only matter when falling back to HTTP/1.1.
+POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0
+)
 
 
 class FirecrawlClient:
     """Async client for Firecrawl v2 API.
 
+    The underlying ``httpx.AsyncClient`` is created on first use and reused for
+    every request, so one instance can serve many calls over a single pool of
+    keep-alive connections. Use it as an async context manager, or call
+    ``aclose()`` when done.
+
+    Rate-limited requests (429) are retried up to ``max_retries`` times after
+    the server's ``Retry-After`` delay; GET/DELETE requests are also retried
+    with exponential backoff on 502/503/504.
+
+    ``trust_server=True`` skips validation of crawl and batch scrape status
+    responses, which are decoded straight into the model. Their page data is
+    untyped anyway, so this only drops checks on the envelope fields.
+
+    Pass ``transport`` to share one connection pool between several clients
+    (e.g. different API keys). The caller owns it: closing a client leaves it
+    open.
+
+    With ``cache_ttl > 0``, GET responses are cached in memory for that many
+    seconds, keyed on endpoint and query params. Jobs that are still running
+    are never cached.
+
+    ``max_concurrency`` caps the number of requests in flight and ``max_rps``
+    spaces request starts at least ``1 / max_rps`` seconds apart, which keeps
+    status polling loops under the account's rate limit. A 429 holds back
+    every request on the client until its ``Retry-After`` has passed.
+
     Example:
         async with FirecrawlClient(api_key) as client:
             result = await client.map(MapRequest(url="https://example.com"))
     """
 
-    __slots__ = ("_api_key", "_base_url", "_client")
-
-    def __init__(self, api_key: str, *, base_url: str = API_BASE) -> None:
-        self._api_key = api_key
+    __slots__ = (
+        "_base_url",
+        "_cache",
+        "_cache_ttl",
+        "_client",
+        "_decoders",
+        "_headers",
+        "_hold_until",
+        "_max_retries",
+        "_min_interval",
+        "_next_request_at",
+        "_semaphore",
+        "_transport",
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: str = API_BASE,
+        cache_ttl: float = 0.0,
+        max_concurrency: int | None = None,
+        max_retries: int = 3,
+        max_rps: float | None = None,
+        trust_server: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._headers = {**BASE_HEADERS, "Authorization": f"Bearer {api_key}"}
         self._base_url = base_url.rstrip("/")
         self._client: httpx.AsyncClient | None = None
+        self._transport = transport
+        self._max_retries = max_retries
+        self._decoders = dict(RESPONSE_DECODERS)
+        if trust_server:
+            self._decoders.update(
+                {t: partial(_construct_json, t) for t in TRUSTED_TYPES}
+            )
+        self._cache_ttl = cache_ttl
+        self._cache: dict[_CacheKey, tuple[float, bytes]] = {}
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+        self._min_interval = 1.0 / max_rps if max_rps else 0.0
+        self._next_request_at = 0.0
+        self._hold_until = 0.0
 
     async def __aenter__(self) -> FirecrawlClient:
-        self._client = httpx.AsyncClient(
-            headers={
-                "Authorization": f"Bearer {self._api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=httpx.Timeout(90.0, read=300.0),
-        )
+        self._ensure_client()
         return self
 
     async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections. The client reopens on the next request."""
         if self._client:
             await self._client.aclose()
+            self._client = None
 
     # === Map ===
 
@@ -85,12 +221,49 @@ class FirecrawlClient:
         """Map URLs from a website."""
         return await self._post("/map", request, MapResponse)
 
+    async def map_many(
+        self, requests: Iterable[MapRequest], *, concurrency: int = 10
+    ) -> list[MapResponse | BaseException]:
+        """Map several websites concurrently.
+
+        At most ``concurrency`` requests are in flight at once. Results are in
+        input order; a failed request yields its exception instead of aborting
+        the batch.
+        """
+        return await self._bounded_gather(map(self.map, requests), concurrency)
+
     # === Scrape ===
 
     async def scrape(self, request: ScrapeRequest) -> ScrapeResponse:
         """Scrape a single URL."""
         return await self._post("/scrape", request, ScrapeResponse)
 
+    async def scrape_many(
+        self,
+        requests: Iterable[ScrapeRequest],
+        *,
+        concurrency: int = 10,
+        per_host: int = MAX_PER_HOST,
+    ) -> list[ScrapeResponse | BaseException]:
+        """Scrape several URLs concurrently.
+
+        At most ``concurrency`` requests are in flight at once, and at most
+        ``per_host`` of them target the same host. Results are in input order;
+        a failed request yields its exception instead of aborting the batch.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        hosts: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            partial(asyncio.Semaphore, per_host)
+        )
+
+        async def run(request: ScrapeRequest) -> ScrapeResponse:
+            # Take the host slot first so requests queued on a busy host don't
+            # hold global slots that other hosts could use.
+            async with hosts[urlsplit(request.url).netloc], sem:
+                return await self.scrape(request)
+
+        return await asyncio.gather(*map(run, requests), return_exceptions=True)
+
     # === Search ===
 
     async def search(self, request: SearchRequest) -> SearchResponse:
@@ -107,10 +280,92 @@ class FirecrawlClient:
         """Get crawl job status."""
         return await self._get(f"/crawl/{job_id}", CrawlStatusResponse)
 
+    async def wait_for_crawl(
+        self,
+        job_id: str,
+        *,
+        poll_interval: float = 0.5,
+        poll_max_interval: float = 10.0,
+        poll_max_wait: float = 180.0,
+        server_wait: float | None = None,
+    ) -> CrawlStatusResponse:
+        """Poll a crawl job until it reaches a terminal status.
+
+        The delay between polls starts at ``poll_interval`` and grows by 1.5x
+        up to ``poll_max_interval``, so short crawls return quickly while long
+        ones are not polled aggressively.
+
+        ``server_wait`` opts into long-polling: it is sent as ``waitSeconds`` so
+        a server that supports it holds the request until the job changes. Time
+        spent blocked on the server counts towards the poll delay, so servers
+        that ignore the parameter fall back to plain backoff polling.
+
+        Raises:
+            TimeoutError: If the job is still running after ``poll_max_wait`` seconds.
+        """
+        params = {"waitSeconds": server_wait} if server_wait else None
+        deadline = time.monotonic() + poll_max_wait
+        delay = poll_interval
+        while True:
+            started = time.monotonic()
+            status = await self._get(
+                f"/crawl/{job_id}", CrawlStatusResponse, params=params
+            )
+            if status.status in TERMINAL_STATUSES:
+                return status
+            now = time.monotonic()
+            if now >= deadline:
+                raise TimeoutError(f"Crawl {job_id} didn't finish in {poll_max_wait}s")
+            pause = delay - (now - started)
+            if pause > 0:
+                await asyncio.sleep(min(pause, deadline - now))
+            delay = min(delay * 1.5, poll_max_interval)
+
+    async def crawl_stream(
+        self, job_id: str, checkpoint_path: str | Path | None = None
+    ) -> AsyncIterator[CrawlStatusResponse]:
+        """Yield a crawl's results page by page, following ``next`` cursors.
+
+        Call it once the crawl has finished; a running crawl only pages through
+        the results available so far.
+
+        With ``checkpoint_path``, the cursor after each page is appended to that
+        JSONL file once the caller has consumed the page, and a later call with
+        the same file resumes after the last recorded page instead of starting
+        over. Entries are tagged with ``job_id``, so one file can hold several
+        jobs; a line torn by a crash is skipped in favour of the one before it.
+        """
+        checkpoint = _Checkpoint(checkpoint_path, job_id) if checkpoint_path else None
+        next_url: str | None = f"{self._base_url}/crawl/{job_id}"
+        seen = 0
+        if checkpoint and (last := checkpoint.last()):
+            next_url, seen = last["next"], last["seen"]
+        try:
+            while next_url:
+                page = await self._get(self._endpoint(next_url), CrawlStatusResponse)
+                yield page
+                seen += len(page.data or ())
+                next_url = page.next
+                if checkpoint:
+                    checkpoint.record(next_url, seen)
+        finally:
+            if checkpoint:
+                checkpoint.close()
+
     async def get_crawl_errors(self, job_id: str) -> JobErrorsResponse:
         """Get crawl job errors."""
         return await self._get(f"/crawl/{job_id}/errors", JobErrorsResponse)
 
+    async def get_crawl_snapshot(
+        self, job_id: str
+    ) -> tuple[CrawlStatusResponse, JobErrorsResponse, QueueStatusResponse]:
+        """Fetch crawl status, crawl errors and queue status concurrently."""
+        async with asyncio.TaskGroup() as tg:
+            status = tg.create_task(self.get_crawl_status(job_id))
+            errors = tg.create_task(self.get_crawl_errors(job_id))
+            queue = tg.create_task(self.get_queue_status())
+        return status.result(), errors.result(), queue.result()
+
     async def get_active_crawls(self) -> ActiveCrawlsResponse:
         """Get all active crawls for the authenticated team."""
         return await self._get("/crawl/active", ActiveCrawlsResponse)
@@ -207,18 +462,95 @@ class FirecrawlClient:
 
     # === Internal ===
 
+    @staticmethod
+    async def _bounded_gather(
+        aws: Iterable[Awaitable[T]], concurrency: int
+    ) -> list[T | BaseException]:
+        sem = asyncio.Semaphore(concurrency)
+
+        async def run(aw: Awaitable[T]) -> T:
+            async with sem:
+                return await aw
+
+        return await asyncio.gather(*map(run, aws), return_exceptions=True)
+
+    def _endpoint(self, url: str) -> str:
+        """Turn an absolute API URL (e.g. a ``next`` cursor) into an endpoint.
+
+        The path is matched on the base URL's last segment (the API version,
+        e.g. ``/v2``), so cursors pointing at the public API still map onto a
+        ``base_url`` behind a proxy prefix.
+        """
+        parts = urlsplit(url)
+        base_path = urlsplit(self._base_url).path
+        version = base_path[base_path.rfind("/") :] if base_path else ""
+        endpoint = parts.path
+        if version:
+            start = endpoint.find(f"{version}/")
+            if start < 0:
+                raise FirecrawlError(f"Cursor {url} is not under {version}")
+            endpoint = endpoint[start + len(version) :]
+        return f"{endpoint}?{parts.query}" if parts.query else endpoint
+
     async def _get(self, endpoint: str, response_type: type[T], **kwargs: Any) -> T:
-        return await self._request("GET", endpoint, response_type, **kwargs)
+        if self._cache_ttl <= 0:
+            return await self._request("GET", endpoint, response_type, **kwargs)
+
+        key = (endpoint, frozenset((kwargs.get("params") or {}).items()))
+        cached = self._cache.get(key)
+        if cached:
+            if cached[0] > time.monotonic():
+                return self._decode(response_type, cached[1])
+            del self._cache[key]
+
+        raw = (await self._send("GET", endpoint, **kwargs)).content
+        result = self._decode(response_type, raw)
+        if getattr(result, "status", None) not in IN_PROGRESS_STATUSES:
+            now = time.monotonic()
+            self._prune_cache(now)
+            self._cache.pop(key, None)
+            self._cache[key] = (now + self._cache_ttl, raw)
+        return result
+
+    def _prune_cache(self, now: float) -> None:
+        """Drop expired entries so the cache never outgrows one TTL's worth."""
+        # Every entry gets the same TTL and is (re)inserted at the end, so
+        # expiry times increase along the dict and the stale ones lead it.
+        while self._cache:
+            key = next(iter(self._cache))
+            if self._cache[key][0] > now:
+                break
+            del self._cache[key]
 
     async def _post(
         self, endpoint: str, request: BaseModel, response_type: type[T]
     ) -> T:
-        payload = request.model_dump(exclude_none=True, by_alias=True, mode="json")
-        return await self._request("POST", endpoint, response_type, json=payload)
+        payload = request.model_dump_json(exclude_none=True, by_alias=True)
+        return await self._request("POST", endpoint, response_type, content=payload)
 
     async def _delete(self, endpoint: str, response_type: type[T]) -> T:
         return await self._request("DELETE", endpoint, response_type)
 
+    def _ensure_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            transport: httpx.AsyncBaseTransport | None = None
+            if self._transport:
+                transport = _SharedTransport(self._transport)
+            elif not _env_proxies():
+                # httpx ignores HTTP(S)_PROXY once a transport is passed, so
+                # only build one (for its connect retries) when none is set.
+                transport = httpx.AsyncHTTPTransport(
+                    http2=True, limits=POOL_LIMITS, retries=CONNECT_RETRIES
+                )
+            self._client = httpx.AsyncClient(
+                headers=self._headers,
+                timeout=TIMEOUT,
+                http2=True,
+                limits=POOL_LIMITS,
+                transport=transport,
+            )
+        return self._client
+
     async def _request(
         self,
         method: str,
@@ -226,24 +558,183 @@ class FirecrawlClient:
         response_type: type[T],
         **kwargs: Any,
     ) -> T:
-        if not self._client:
-            raise FirecrawlError("Client not initialized. Use 'async with' context.")
-        resp = await self._client.request(
-            method, f"{self._base_url}{endpoint}", **kwargs
-        )
+        resp = await self._send(method, endpoint, **kwargs)
+        return self._decode(response_type, resp.content)
+
+    def _decode(self, response_type: type[T], raw: bytes) -> T:
+        return cast(T, self._decoders[response_type](raw))
+
+    async def _send(self, method: str, endpoint: str, **kwargs: Any) -> httpx.Response:
+        client = self._ensure_client()
+        url = f"{self._base_url}{endpoint}"
+        for attempt in range(self._max_retries + 1):
+            async with self._semaphore or nullcontext():
+                await self._pace()
+                resp = await client.request(method, url, **kwargs)
+            delay = _retry_delay(method, resp, attempt)
+            if resp.status_code == 429:
+                # The limit is per account, so hold back every request on this
+                # client, retried or not; _pace() waits out the hold.
+                retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+                hold = retry_after if retry_after is not None else delay
+                if hold:
+                    self._hold_until = max(self._hold_until, time.monotonic() + hold)
+                if delay is not None:
+                    delay = 0.0
+            if delay is None or attempt == self._max_retries:
+                break
+            await asyncio.sleep(delay)
         self._check_response(resp)
-        return response_type.model_validate(resp.json())
+        return resp
+
+    async def _pace(self) -> None:
+        """Wait for this request's start slot under ``max_rps`` and 429 holds."""
+        now = time.monotonic()
+        start = max(now, self._next_request_at, self._hold_until)
+        while True:
+            # Reserve the slot before sleeping so concurrent callers queue up
+            # behind it instead of all waking at the same time.
+            self._next_request_at = start + self._min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+                now = time.monotonic()
+            if self._hold_until <= now:
+                return
+            # A 429 arrived while we slept: queue up again behind its hold.
+            start = max(self._next_request_at, self._hold_until)
 
     def _check_response(self, resp: httpx.Response) -> None:
+        if resp.status_code < 400:
+            return
         if resp.status_code == 401:
             raise AuthenticationError("Invalid API key")
         if resp.status_code == 402:
             raise PaymentRequiredError("Insufficient credits")
         if resp.status_code == 429:
-            raise RateLimitError("Rate limit exceeded")
-        if resp.status_code >= 400:
-            try:
-                msg = resp.json().get("error", resp.text)
-            except Exception:
-                msg = resp.text
-            raise FirecrawlError(f"HTTP {resp.status_code}: {msg}")
+            raise RateLimitError(
+                "Rate limit exceeded",
+                retry_after=_parse_retry_after(resp.headers.get("Retry-After")),
+            )
+        raise FirecrawlError(f"HTTP {resp.status_code}: {_error_message(resp)}")
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Delegates to a caller-owned transport without closing it."""
+
+    __slots__ = ("_transport",)
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _Checkpoint:
+    """Append-only JSONL log of pagination cursors for ``crawl_stream``."""
+
+    __slots__ = ("_file", "_job_id", "_path", "_unsynced")
+
+    def __init__(self, path: str | Path, job_id: str) -> None:
+        self._path = Path(path)
+        self._job_id = job_id
+        self._file: BinaryIO | None = None
+        self._unsynced = 0
+
+    def last(self) -> dict[str, Any] | None:
+        """Return this job's newest complete entry, or None if there is none."""
+        entry = None
+        try:
+            with self._path.open("rb") as f:
+                for line in f:
+                    try:
+                        parsed = pydantic_core.from_json(line)
+                    except ValueError:  # torn write from a crash or power loss
+                        continue
+                    if isinstance(parsed, dict) and parsed.get("job") == self._job_id:
+                        entry = parsed
+        except FileNotFoundError:
+            return None
+        return entry
+
+    def record(self, next_url: str | None, seen: int) -> None:
+        if self._file is None:
+            self._file = self._path.open("a+b")
+            if end := self._file.seek(0, os.SEEK_END):
+                self._file.seek(end - 1)
+                if self._file.read(1) != b"\n":
+                    self._file.write(b"\n")  # don't extend a torn last line
+        entry = {"job": self._job_id, "next": next_url, "seen": seen}
+        # Flushing per page survives a process crash; fsync is batched.
+        self._file.write(pydantic_core.to_json(entry) + b"\n")
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= CHECKPOINT_SYNC_EVERY:
+            self._sync()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    def _sync(self) -> None:
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+
+def _env_proxies() -> bool:
+    """Whether a proxy is configured through HTTP_PROXY/HTTPS_PROXY/ALL_PROXY."""
+    proxies = urllib.request.getproxies()
+    return any(scheme in proxies for scheme in ("http", "https", "all"))
+
+
+def _construct_json(response_type: type[BaseModel], raw: bytes) -> BaseModel:
+    return response_type.model_construct(**pydantic_core.from_json(raw))
+
+
+def _error_message(resp: httpx.Response) -> str:
+    """Pull the ``error`` field from an error body, falling back to its text."""
+    try:
+        body = pydantic_core.from_json(resp.content)
+    except ValueError:
+        return resp.text
+    if isinstance(body, dict) and body.get("error"):
+        return str(body["error"])
+    return resp.text
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given as seconds or an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def _retry_delay(method: str, resp: httpx.Response, attempt: int) -> float | None:
+    """Seconds to wait before retrying ``resp``, or None if it shouldn't be."""
+    if resp.status_code == 429:
+        delay = _parse_retry_after(resp.headers.get("Retry-After"))
+        if delay is None:
+            delay = RETRY_BACKOFF * 2**attempt
+    elif resp.status_code in RETRY_STATUSES and method in IDEMPOTENT_METHODS:
+        delay = RETRY_BACKOFF * 2**attempt
+    else:
+        return None
+    if delay > MAX_RETRY_DELAY:
+        return None
+    return delay + random.uniform(0, 0.5)
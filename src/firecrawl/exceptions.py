@@ -13,7 +13,14 @@ class FirecrawlError(Exception):
 
 
 class RateLimitError(FirecrawlError):
-    """HTTP 429 - Rate limit exceeded."""
+    """HTTP 429 - Rate limit exceeded.
+
+    ``retry_after`` holds the server's ``Retry-After`` hint in seconds, if any.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class PaymentRequiredError(FirecrawlError):
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
-
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from typing import Annotated, Any, Literal
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    TypeAdapter,
+    ValidationError,
+)
+from pydantic.dataclasses import dataclass
 
 __all__ = [
     "ActiveCrawl",
@@ -57,13 +67,58 @@ DEFAULT_FORMATS: list[str | dict[str, Any]] = ["markdown"]
 DEFAULT_SOURCES: list[str | dict[str, str]] = ["web"]
 
 
+_HTTP_URL = TypeAdapter(HttpUrl)
+
+
+def _check_http_url(url: str) -> str:
+    if url.startswith("https://"):
+        host = url[8:9]
+    elif url.startswith("http://"):
+        host = url[7:8]
+    else:
+        host = ""
+    # Userinfo ("@") and empty hosts (":80", "/path") go to the full parser.
+    if (
+        host
+        and host not in "/?#:@"
+        and " " not in url
+        and "@" not in url
+        and url.isprintable()
+    ):
+        return url
+    # Anything unusual (mixed-case scheme, padding, no host, bad characters)
+    # goes through the full parser, which normalizes or rejects it.
+    try:
+        return str(_HTTP_URL.validate_python(url))
+    except ValidationError as e:
+        msg = e.errors()[0]["msg"]
+        raise ValueError(f"URL must be an http:// or https:// URL ({msg})") from None
+
+
+# Outbound URLs are re-validated by the API, so clean-looking URLs only get a
+# cheap syntax check and skip the HttpUrl parse.
+_HttpURL = Annotated[str, AfterValidator(_check_http_url)]
+
+
+def _dedupe(urls: Any) -> Any:
+    """Drop repeated URLs, keeping the first occurrence of each in order."""
+    try:
+        return list(dict.fromkeys(urls)) if isinstance(urls, list) else urls
+    except TypeError:  # unhashable items; leave them to the item validator
+        return urls
+
+
+# Runs before item validation, so duplicates are neither checked nor sent.
+_UniqueURLs = BeforeValidator(_dedupe)
+
+
 # === Shared ===
 
 
 class CancelResponse(BaseModel):
     """Response for cancel/delete operations across endpoints."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore")
 
     success: bool | None = None
     status: str | None = None
@@ -83,7 +138,7 @@ class LocationSettings(BaseModel):
 class MapRequest(BaseModel):
     """POST /v2/map request."""
 
-    url: HttpUrl
+    url: _HttpURL
     search: str | None = None
     sitemap: Literal["skip", "include", "only"] = "include"
     includeSubdomains: bool = True
@@ -93,8 +148,14 @@ class MapRequest(BaseModel):
     timeout: int | None = None
 
 
-class Link(BaseModel):
-    """Individual link in map response."""
+@dataclass(slots=True)
+class Link:
+    """Individual link in map response.
+
+    A slotted dataclass rather than a model: map responses can hold up to
+    100k links, and dropping the per-instance ``__dict__`` cuts their memory
+    roughly 4x.
+    """
 
     url: str
     title: str | None = None
@@ -104,6 +165,9 @@ class Link(BaseModel):
 class MapResponse(BaseModel):
     """POST /v2/map response."""
 
+    # Up to 100k unique URLs per response only churn pydantic's string cache.
+    model_config = ConfigDict(cache_strings="keys")
+
     success: bool
     links: list[Link]
 
@@ -114,7 +178,7 @@ class MapResponse(BaseModel):
 class ScrapeRequest(BaseModel):
     """POST /v2/scrape request."""
 
-    url: HttpUrl
+    url: _HttpURL
     formats: list[str | dict[str, Any]] = Field(
         default_factory=lambda: DEFAULT_FORMATS.copy()
     )
@@ -152,10 +216,22 @@ class ScrapeMetadata(BaseModel):
     error: str | None = None
 
 
+class ChangeTrackingData(BaseModel):
+    """Change tracking information from scrape responses."""
+
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+    previousScrapeAt: str | None = None
+    changeStatus: str | None = None
+    visibility: str | None = None
+    diff: str | None = None
+    json_data: dict[str, Any] | None = Field(None, alias="json")
+
+
 class ScrapeData(BaseModel):
     """Data from scrape response."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
     markdown: str | None = None
     summary: str | None = None
@@ -172,18 +248,6 @@ class ScrapeData(BaseModel):
     changeTracking: ChangeTrackingData | None = None
 
 
-class ChangeTrackingData(BaseModel):
-    """Change tracking information from scrape responses."""
-
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
-
-    previousScrapeAt: str | None = None
-    changeStatus: str | None = None
-    visibility: str | None = None
-    diff: str | None = None
-    json_data: dict[str, Any] | None = Field(None, alias="json")
-
-
 class ScrapeResponse(BaseModel):
     """POST /v2/scrape response."""
 
@@ -214,6 +278,7 @@ class SearchRequest(BaseModel):
 class SearchWebResult(BaseModel):
     """Web search result."""
 
+    # Scraped results carry whichever formats scrapeOptions asked for.
     model_config = ConfigDict(extra="allow")
 
     title: str
@@ -232,7 +297,7 @@ class SearchWebResult(BaseModel):
 class SearchImageResult(BaseModel):
     """Image search result."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore")
 
     title: str
     imageUrl: str
@@ -245,6 +310,7 @@ class SearchImageResult(BaseModel):
 class SearchNewsResult(BaseModel):
     """News search result."""
 
+    # Scraped results carry whichever formats scrapeOptions asked for.
     model_config = ConfigDict(extra="allow")
 
     title: str
@@ -285,7 +351,7 @@ class SearchResponse(BaseModel):
 class CrawlRequest(BaseModel):
     """POST /v2/crawl request."""
 
-    url: HttpUrl
+    url: _HttpURL
     prompt: str | None = None
     excludePaths: list[str] | None = None
     includePaths: list[str] | None = None
@@ -328,7 +394,7 @@ class CrawlStatusResponse(BaseModel):
 class CrawlParamsPreviewRequest(BaseModel):
     """POST /v2/crawl/params-preview request."""
 
-    url: HttpUrl
+    url: _HttpURL
     prompt: str = Field(..., max_length=10000)
 
 
@@ -359,7 +425,8 @@ class CrawlParamsPreviewResponse(BaseModel):
     data: CrawlParamsPreviewData
 
 
-class JobError(BaseModel):
+@dataclass(slots=True)
+class JobError:
     """Error detail for crawl/batch scrape errors endpoints."""
 
     id: str
@@ -399,7 +466,7 @@ class ActiveCrawlsResponse(BaseModel):
 class BatchScrapeRequest(BaseModel):
     """POST /v2/batch/scrape request."""
 
-    urls: list[HttpUrl]
+    urls: Annotated[list[_HttpURL], _UniqueURLs]
     formats: list[str | dict[str, Any]] = Field(
         default_factory=lambda: DEFAULT_FORMATS.copy()
     )
@@ -454,7 +521,7 @@ class ExtractRequest(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
-    urls: list[str]
+    urls: Annotated[list[str], _UniqueURLs]
     prompt: str | None = None
     schema_: dict[str, Any] | None = Field(None, alias="schema")
     enableWebSearch: bool = False
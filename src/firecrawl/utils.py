@@ -3,14 +3,12 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 __all__ = ["load_api_key"]
 
-_KEY_PATHS = (
-    Path("~/.secrets/firecrawl.key"),
-    Path("~/.secrets"),
-)
+_KEY_PATHS = (Path("~/.secrets/firecrawl.key"), Path("~/.secrets"))
 
 
 def load_api_key(key_file: str | Path | None = None) -> str:
@@ -22,6 +20,9 @@ def load_api_key(key_file: str | Path | None = None) -> str:
         3. ~/.secrets/firecrawl.key
         4. ~/.secrets (first line starting with 'fc-')
 
+    The environment variable is checked on every call; keys read from files
+    are cached for the life of the process.
+
     Args:
         key_file: Optional path to API key file.
 
@@ -33,19 +34,24 @@ def load_api_key(key_file: str | Path | None = None) -> str:
     """
     if key := os.getenv("FIRECRAWL_API_KEY"):
         return key.strip()
+    return _load_api_key_from_files(str(key_file) if key_file else None)
+
 
+@lru_cache(maxsize=8)
+def _load_api_key_from_files(key_file: str | None) -> str:
     if key_file:
         return Path(key_file).expanduser().read_text().strip()
 
     for path in _KEY_PATHS:
-        p = path.expanduser()
-        if p.exists():
-            content = p.read_text().strip()
-            for line in content.splitlines():
-                if line.strip().startswith("fc-"):
-                    return line.strip()
-            if content.startswith("fc-"):
-                return content
+        try:
+            with path.expanduser().open() as f:
+                for line in f:
+                    if (line := line.strip()).startswith("fc-"):
+                        return line
+        # NotADirectoryError covers ~/.secrets being a file itself, and
+        # RuntimeError a process with no home directory to expand ~ against.
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError, RuntimeError):
+            continue
 
     raise ValueError(
         "No API key found. Set FIRECRAWL_API_KEY or create ~/.secrets/firecrawl.key"
@@ -1,12 +1,46 @@
 """Tests for FirecrawlClient."""
 
+import asyncio
+import inspect
+import itertools
+import json
+import time
+import typing
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
 import pytest
+from pydantic import BaseModel
+
+from firecrawl import (
+    AgentRequest,
+    ExtractRequest,
+    FirecrawlClient,
+    FirecrawlError,
+    MapRequest,
+    RateLimitError,
+    ScrapeRequest,
+    ScrapeResponse,
+)
+from firecrawl.client import RESPONSE_DECODERS, _parse_retry_after
+
+Handler = Callable[[httpx.Request], httpx.Response | Awaitable[httpx.Response]]
+
 
-from firecrawl import FirecrawlClient, FirecrawlError
+def _mock_client(handler: Handler, **kwargs: Any) -> FirecrawlClient:
+    return FirecrawlClient("fc-test", transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.fixture
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("firecrawl.client.RETRY_BACKOFF", 0.0)
+    monkeypatch.setattr("firecrawl.client.random.uniform", lambda a, b: 0.0)
 
 
 class TestFirecrawlClient:
-    def test_client_requires_context_manager(self) -> None:
+    def test_client_created_lazily(self) -> None:
         client = FirecrawlClient("fc-test")
         assert client._client is None
 
@@ -17,9 +51,501 @@ class TestFirecrawlClient:
         assert client._client is None or client._client.is_closed
 
     @pytest.mark.asyncio
-    async def test_client_not_initialized_error(self) -> None:
+    async def test_client_reused_without_context_manager(self) -> None:
         client = FirecrawlClient("fc-test")
-        with pytest.raises(FirecrawlError, match="not initialized"):
-            from firecrawl import MapRequest
+        http = client._ensure_client()
+        assert client._ensure_client() is http
+        await client.aclose()
+        assert http.is_closed
+        assert client._client is None
+
+    def test_every_response_type_has_a_decoder(self) -> None:
+        for name, method in inspect.getmembers(
+            FirecrawlClient, inspect.iscoroutinefunction
+        ):
+            returned = typing.get_type_hints(method)["return"]
+            for tp in typing.get_args(returned) or (returned,):
+                if isinstance(tp, type) and issubclass(tp, BaseModel):
+                    assert tp in RESPONSE_DECODERS, (name, tp)
+
+    @pytest.mark.asyncio
+    async def test_shared_transport_outlives_clients(self) -> None:
+        class Transport(httpx.MockTransport):
+            closed = False
+
+            async def aclose(self) -> None:
+                self.closed = True
+
+        shared = Transport(lambda request: httpx.Response(200, json={"status": "ok"}))
+        async with FirecrawlClient("fc-a", transport=shared) as a:
+            await a.get_crawl_status("job-1")
+        async with FirecrawlClient("fc-b", transport=shared) as b:
+            await b.get_crawl_status("job-1")
+        assert not shared.closed
+
+    @pytest.mark.asyncio
+    async def test_env_proxy_honoured(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.local:8080")
+        async with FirecrawlClient("fc-test") as client:
+            assert client._client is not None
+            assert any(t is not None for t in client._client._mounts.values())
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, json={"error": "boom"})
+
+        client = _mock_client(handler)
+        with pytest.raises(FirecrawlError, match="HTTP 500: boom"):
+            await client.map(MapRequest(url="https://example.com"))
+
+    @pytest.mark.asyncio
+    async def test_non_json_error_response_uses_text(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, text="<html>Bad Request</html>")
 
+        client = _mock_client(handler)
+        with pytest.raises(FirecrawlError, match="HTTP 400: <html>Bad Request"):
             await client.map(MapRequest(url="https://example.com"))
+
+
+class TestRequestBody:
+    @pytest.mark.asyncio
+    async def test_post_body_uses_aliases_and_drops_none(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["Authorization"] == "Bearer fc-test"
+            assert request.headers["Content-Type"] == "application/json"
+            body = json.loads(request.content)
+            assert body["schema"] == {"type": "object"}
+            assert "prompt" not in body
+            return httpx.Response(200, json={"success": True, "id": "job-1"})
+
+        client = _mock_client(handler)
+        job = await client.extract(
+            ExtractRequest(urls=["https://example.com"], schema_={"type": "object"})
+        )
+        assert job.id == "job-1"
+
+    @pytest.mark.asyncio
+    async def test_agent_body_serializes_schema_alias(self) -> None:
+        bodies: list[dict[str, Any]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={"success": True, "id": "job-1"})
+
+        client = _mock_client(handler)
+        await client.agent(
+            AgentRequest(prompt="Find prices", schema={"type": "object"})
+        )
+        assert bodies == [
+            {
+                "prompt": "Find prices",
+                "schema": {"type": "object"},
+                "strictConstrainToURLs": False,
+            }
+        ]
+
+
+class TestTrustServer:
+    @pytest.mark.asyncio
+    async def test_status_decoded_without_validation(self) -> None:
+        body = {"status": "completed", "total": 1, "data": [{"markdown": "# Hi"}]}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=body)
+
+        trusted = _mock_client(handler, trust_server=True)
+        fast = await trusted.get_crawl_status("job-1")
+        slow = await _mock_client(handler).get_crawl_status("job-1")
+        assert fast == slow
+        assert fast.data == [{"markdown": "# Hi"}]
+
+
+class TestWaitForCrawl:
+    @pytest.mark.asyncio
+    async def test_polls_until_terminal(self) -> None:
+        statuses = iter(["scraping", "scraping", "completed"])
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            assert request.url.path == "/v2/crawl/job-1"
+            return httpx.Response(200, json={"status": next(statuses), "data": []})
+
+        client = _mock_client(handler)
+        status = await client.wait_for_crawl("job-1", poll_interval=0.001)
+        assert status.status == "completed"
+        assert calls == 3
+
+    @pytest.mark.asyncio
+    async def test_times_out(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"status": "scraping"})
+
+        client = _mock_client(handler)
+        with pytest.raises(TimeoutError):
+            await client.wait_for_crawl(
+                "job-1", poll_interval=0.001, poll_max_wait=0.01
+            )
+
+    @pytest.mark.asyncio
+    async def test_server_wait_sent_as_query_param(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["waitSeconds"] == "30.0"
+            return httpx.Response(200, json={"status": "completed"})
+
+        client = _mock_client(handler)
+        status = await client.wait_for_crawl("job-1", server_wait=30.0)
+        assert status.status == "completed"
+
+
+class TestCrawlSnapshot:
+    @pytest.mark.asyncio
+    async def test_fetches_all_three(self) -> None:
+        bodies = {
+            "/v2/crawl/job-1": {"status": "scraping"},
+            "/v2/crawl/job-1/errors": {"errors": []},
+            "/v2/team/queue-status": {
+                "success": True,
+                "jobsInQueue": 1,
+                "activeJobsInQueue": 1,
+                "waitingJobsInQueue": 0,
+                "maxConcurrency": 2,
+            },
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=bodies[request.url.path])
+
+        client = _mock_client(handler)
+        status, errors, queue = await client.get_crawl_snapshot("job-1")
+        assert status.status == "scraping"
+        assert errors.errors == []
+        assert queue.maxConcurrency == 2
+
+
+class TestCrawlStream:
+    @staticmethod
+    def _handler(requested: list[str]) -> Handler:
+        def handler(request: httpx.Request) -> httpx.Response:
+            skip = int(request.url.params.get("skip", 0))
+            requested.append(request.url.path + f"?skip={skip}")
+            next_url = (
+                f"https://api.firecrawl.dev/v2/crawl/job-1?skip={skip + 1}"
+                if skip < 2
+                else None
+            )
+            return httpx.Response(
+                200,
+                json={"status": "completed", "data": [{"n": skip}], "next": next_url},
+            )
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_follows_next_cursors(self) -> None:
+        requested: list[str] = []
+        client = _mock_client(self._handler(requested))
+        pages = [page async for page in client.crawl_stream("job-1")]
+        assert [page.data for page in pages] == [[{"n": 0}], [{"n": 1}], [{"n": 2}]]
+        assert requested == [
+            "/v2/crawl/job-1?skip=0",
+            "/v2/crawl/job-1?skip=1",
+            "/v2/crawl/job-1?skip=2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cursors_follow_base_url_prefix(self) -> None:
+        requested: list[str] = []
+        client = _mock_client(
+            self._handler(requested), base_url="https://proxy.example/fc/v2"
+        )
+        pages = [page async for page in client.crawl_stream("job-1")]
+        assert len(pages) == 3
+        assert requested == [
+            "/fc/v2/crawl/job-1?skip=0",
+            "/fc/v2/crawl/job-1?skip=1",
+            "/fc/v2/crawl/job-1?skip=2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint(self, tmp_path: Path) -> None:
+        checkpoint = tmp_path / "crawl.jsonl"
+        requested: list[str] = []
+        client = _mock_client(self._handler(requested))
+        async for page in client.crawl_stream("job-1", checkpoint):
+            if page.data == [{"n": 1}]:
+                break  # crash while handling the second page
+
+        requested.clear()
+        pages = [page async for page in client.crawl_stream("job-1", checkpoint)]
+        assert [page.data for page in pages] == [[{"n": 1}], [{"n": 2}]]
+        assert requested[0] == "/v2/crawl/job-1?skip=1"
+        last = json.loads(checkpoint.read_text().splitlines()[-1])
+        assert last == {"job": "job-1", "next": None, "seen": 3}
+
+        requested.clear()
+        assert [page async for page in client.crawl_stream("job-1", checkpoint)] == []
+        assert requested == []
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_skips_torn_and_foreign_entries(
+        self, tmp_path: Path
+    ) -> None:
+        checkpoint = tmp_path / "crawl.jsonl"
+        cursor = "https://api.firecrawl.dev/v2/crawl/job-1?skip=1"
+        checkpoint.write_text(
+            json.dumps({"job": "job-1", "next": cursor, "seen": 1})
+            + "\n"
+            + json.dumps({"job": "job-2", "next": None, "seen": 9})
+            + '\n{"job": "job-1", "next": "https://api.fire'
+        )
+        requested: list[str] = []
+        client = _mock_client(self._handler(requested))
+        pages = [page async for page in client.crawl_stream("job-1", checkpoint)]
+        assert [page.data for page in pages] == [[{"n": 1}], [{"n": 2}]]
+        last = json.loads(checkpoint.read_text().splitlines()[-1])
+        assert last == {"job": "job-1", "next": None, "seen": 3}
+
+
+class TestRetries:
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_backoff")
+    async def test_retries_rate_limit_then_succeeds(self) -> None:
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"status": "completed"}),
+            ]
+        )
+
+        client = _mock_client(lambda request: next(responses))
+        status = await client.get_crawl_status("job-1")
+        assert status.status == "completed"
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_backoff")
+    async def test_rate_limit_exhausted_exposes_retry_after(self) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(429, headers={"Retry-After": "0"})
+
+        client = _mock_client(handler)
+        with pytest.raises(RateLimitError) as exc_info:
+            await client.get_crawl_status("job-1")
+        assert calls == 4
+        assert exc_info.value.retry_after == 0.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_backoff")
+    async def test_server_errors_retried_only_for_idempotent_methods(self) -> None:
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            return httpx.Response(503, json={"error": "unavailable"})
+
+        client = _mock_client(handler)
+        with pytest.raises(FirecrawlError, match="HTTP 503"):
+            await client.get_crawl_status("job-1")
+        with pytest.raises(FirecrawlError, match="HTTP 503"):
+            await client.scrape(ScrapeRequest(url="https://example.com"))
+        assert calls == ["GET"] * 4 + ["POST"]
+
+    def test_parse_retry_after(self) -> None:
+        assert _parse_retry_after("2.5") == 2.5
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert _parse_retry_after("soon") is None
+        assert _parse_retry_after(None) is None
+
+
+class TestThrottling:
+    @pytest.mark.asyncio
+    async def test_max_rps_spaces_requests(self) -> None:
+        starts: list[float] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            starts.append(time.monotonic())
+            return httpx.Response(200, json={"status": "scraping"})
+
+        client = _mock_client(handler, max_rps=50)
+        await asyncio.gather(*(client.get_crawl_status("job-1") for _ in range(4)))
+        gaps = [b - a for a, b in itertools.pairwise(starts)]
+        assert min(gaps) >= 0.015
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_caps_in_flight(self) -> None:
+        in_flight = peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"status": "scraping"})
+
+        client = _mock_client(handler, max_concurrency=2)
+        await asyncio.gather(*(client.get_crawl_status("job-1") for _ in range(6)))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_backoff")
+    async def test_rate_limit_holds_back_later_requests(self) -> None:
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "0.05"}),
+                httpx.Response(200, json={"status": "completed"}),
+            ]
+        )
+
+        client = _mock_client(lambda request: next(responses), max_retries=0)
+        with pytest.raises(RateLimitError):
+            await client.get_crawl_status("job-1")
+        start = time.monotonic()
+        await client.get_crawl_status("job-1")
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_backoff")
+    async def test_rate_limit_holds_back_paced_requests(self) -> None:
+        starts: list[float] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            starts.append(time.monotonic())
+            if len(starts) == 1:
+                # Answer after the other polls have reserved their slots.
+                await asyncio.sleep(0.01)
+                return httpx.Response(429, headers={"Retry-After": "0.2"})
+            return httpx.Response(200, json={"status": "scraping"})
+
+        client = _mock_client(handler, max_rps=20, max_retries=0)
+        await asyncio.gather(
+            *(client.get_crawl_status("job-1") for _ in range(5)),
+            return_exceptions=True,
+        )
+        assert min(starts[1:]) - starts[0] >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_hold_beyond_max_retry_delay(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("firecrawl.client.MAX_RETRY_DELAY", 0.01)
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "0.05"}),
+                httpx.Response(200, json={"status": "completed"}),
+            ]
+        )
+
+        client = _mock_client(lambda request: next(responses))
+        with pytest.raises(RateLimitError):
+            await client.get_crawl_status("job-1")
+        start = time.monotonic()
+        await client.get_crawl_status("job-1")
+        assert time.monotonic() - start >= 0.04
+
+
+class TestScrapeMany:
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_backoff")
+    async def test_bounded_concurrency_and_order(self) -> None:
+        in_flight = peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            url = request.read().decode()
+            if "bad" in url:
+                return httpx.Response(429)
+            return httpx.Response(
+                200, json={"success": True, "data": {"markdown": url}}
+            )
+
+        client = _mock_client(handler)
+        urls = [f"https://example.com/{i}" for i in range(6)] + ["https://bad.com"]
+        results = await client.scrape_many(
+            [ScrapeRequest(url=u) for u in urls], concurrency=2
+        )
+
+        assert peak == 2
+        assert isinstance(results[-1], RateLimitError)
+        first = results[0]
+        assert isinstance(first, ScrapeResponse)
+        assert first.data.markdown is not None
+        assert "example.com/0" in first.data.markdown
+
+    @pytest.mark.asyncio
+    async def test_per_host_cap(self) -> None:
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = json.loads(request.read())["url"].split("/")[2]
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200, json={"success": True, "data": {}})
+
+        client = _mock_client(handler)
+        urls = [f"https://a.com/{i}" for i in range(6)] + ["https://b.com/"] * 3
+        results = await client.scrape_many(
+            [ScrapeRequest(url=u) for u in urls], concurrency=5, per_host=2
+        )
+
+        assert all(isinstance(r, ScrapeResponse) for r in results)
+        assert peak == {"a.com": 2, "b.com": 2}
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_get_cached_within_ttl(self) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, json={"status": "completed", "total": calls})
+
+        client = _mock_client(handler, cache_ttl=60.0)
+        first = await client.get_crawl_status("job-1")
+        second = await client.get_crawl_status("job-1")
+        assert calls == 1
+        assert first == second
+        await client.get_crawl_status("job-2")
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_in_progress_not_cached(self) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, json={"status": "scraping"})
+
+        client = _mock_client(handler, cache_ttl=60.0)
+        await client.get_crawl_status("job-1")
+        await client.get_crawl_status("job-1")
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_evicted(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"status": "completed"})
+
+        client = _mock_client(handler, cache_ttl=0.01)
+        for i in range(50):
+            await client.get_crawl_status(f"job-{i}")
+        await asyncio.sleep(0.02)
+        await client.get_crawl_status("job-new")
+        assert list(client._cache) == [("/crawl/job-new", frozenset())]
@@ -1,11 +1,13 @@
 """Tests for Pydantic models."""
 
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from firecrawl import (
     AgentRequest,
+    BatchScrapeRequest,
     CancelResponse,
+    ChangeTrackingData,
     CrawlParamsPreviewRequest,
     CrawlRequest,
     CreditUsageResponse,
@@ -16,14 +18,16 @@ from firecrawl import (
     ScrapeData,
     ScrapeRequest,
     ScrapeResponse,
+    SearchImageResult,
     SearchRequest,
+    SearchResponse,
 )
 
 
 class TestMapModels:
     def test_map_request_minimal(self) -> None:
         req = MapRequest(url="https://example.com")
-        assert str(req.url) == "https://example.com/"
+        assert req.url == "https://example.com"
         assert req.limit == 5000
         assert req.sitemap == "include"
 
@@ -53,6 +57,14 @@ class TestMapModels:
         assert len(resp.links) == 2
         assert resp.links[0].title == "Page 1"
 
+    def test_map_response_from_json(self) -> None:
+        resp = MapResponse.model_validate_json(
+            b'{"success": true, "links": [{"url": "https://example.com/a"}]}'
+        )
+        assert resp.links[0] == Link(url="https://example.com/a")
+        assert not hasattr(resp.links[0], "__dict__")
+        assert resp.model_dump()["links"][0]["url"] == "https://example.com/a"
+
 
 class TestScrapeModels:
     def test_scrape_request_minimal(self) -> None:
@@ -60,6 +72,35 @@ class TestScrapeModels:
         assert req.formats == ["markdown"]
         assert req.onlyMainContent is True
 
+    def test_scrape_request_invalid_url(self) -> None:
+        with pytest.raises(ValidationError, match="http:// or https://"):
+            ScrapeRequest(url="ftp://example.com")
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://example.com/a?b=1", "https://example.com/a?b=1"),
+            ("HTTPS://Example.com", "https://example.com/"),
+            (" https://example.com", "https://example.com/"),
+        ],
+    )
+    def test_scrape_request_url_normalized(self, url: str, expected: str) -> None:
+        assert ScrapeRequest(url=url).url == expected
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://",
+            "http://:80",
+            "https://@",
+            "http://exa mple.com",
+            "example.com",
+        ],
+    )
+    def test_scrape_request_malformed_url(self, url: str) -> None:
+        with pytest.raises(ValidationError, match="http:// or https://"):
+            ScrapeRequest(url=url)
+
     def test_scrape_request_with_json(self) -> None:
         req = ScrapeRequest(
             url="https://example.com",
@@ -103,6 +144,23 @@ class TestSearchModels:
         )
         assert req.tbs == "qdr:d"
 
+    def test_search_results_keep_extra_formats(self) -> None:
+        resp = SearchResponse.model_validate(
+            {
+                "success": True,
+                "data": {
+                    "web": [
+                        {"title": "t", "url": "u", "summary": "S", "json": {"a": 1}}
+                    ],
+                    "news": [{"title": "t", "url": "u", "position": 1, "summary": "N"}],
+                },
+            }
+        )
+        assert resp.data.web is not None
+        assert resp.data.web[0].model_extra == {"summary": "S", "json": {"a": 1}}
+        assert resp.data.news is not None
+        assert resp.data.news[0].model_extra == {"summary": "N"}
+
 
 class TestMiscModels:
     def test_cancel_response_variants(self) -> None:
@@ -129,10 +187,11 @@ class TestMiscModels:
             }
         )
         assert resp.errors[0].id == "1"
+        assert not hasattr(resp.errors[0], "__dict__")
 
     def test_crawl_params_preview_request(self) -> None:
         req = CrawlParamsPreviewRequest(url="https://example.com", prompt="Crawl blog")
-        assert str(req.url) == "https://example.com/"
+        assert req.url == "https://example.com"
 
     def test_credit_usage_response(self) -> None:
         resp = CreditUsageResponse.model_validate(
@@ -165,6 +224,20 @@ class TestCrawlModels:
         assert req.prompt == "Only crawl blog posts"
 
 
+class TestBatchScrapeModels:
+    def test_batch_scrape_request_urls(self) -> None:
+        req = BatchScrapeRequest(urls=["https://example.com/a", "http://example.com/b"])
+        assert req.urls == ["https://example.com/a", "http://example.com/b"]
+
+    def test_batch_scrape_request_invalid_url(self) -> None:
+        with pytest.raises(ValidationError, match=r"urls\.1"):
+            BatchScrapeRequest(urls=["https://example.com", "example.com"])
+
+    def test_batch_scrape_request_dedupes_urls(self) -> None:
+        urls = ["https://a.com", "https://b.com", "https://a.com", "https://b.com"]
+        assert BatchScrapeRequest(urls=urls).urls == ["https://a.com", "https://b.com"]
+
+
 class TestAgentModels:
     def test_agent_request_minimal(self) -> None:
         req = AgentRequest(prompt="Extract product info")
@@ -181,3 +254,62 @@ class TestAgentModels:
         )
         assert req.maxCredits == 100
         assert req.strictConstrainToURLs is True
+
+
+class TestPinnedResponseSchemas:
+    """These models drop unknown fields; update them when the API adds some."""
+
+    @pytest.mark.parametrize(
+        ("model", "fields"),
+        [
+            (CancelResponse, {"success", "status", "message"}),
+            (
+                ScrapeData,
+                {
+                    "markdown",
+                    "summary",
+                    "html",
+                    "rawHtml",
+                    "links",
+                    "images",
+                    "screenshot",
+                    "json_data",
+                    "branding",
+                    "actions",
+                    "metadata",
+                    "warning",
+                    "changeTracking",
+                },
+            ),
+            (
+                ChangeTrackingData,
+                {"previousScrapeAt", "changeStatus", "visibility", "diff", "json_data"},
+            ),
+            (
+                SearchImageResult,
+                {"title", "imageUrl", "imageWidth", "imageHeight", "url", "position"},
+            ),
+        ],
+    )
+    def test_known_fields(self, model: type[BaseModel], fields: set[str]) -> None:
+        assert set(model.model_fields) == fields
+        assert model.model_config["extra"] == "ignore"
+
+    def test_unknown_fields_dropped(self) -> None:
+        data = ScrapeData.model_validate({"markdown": "# Hi", "newFormat": "x"})
+        assert data.model_extra is None
+        assert not hasattr(data, "newFormat")
+
+
+class TestSchemaBuild:
+    def test_all_models_complete_at_import(self) -> None:
+        from firecrawl import models
+
+        incomplete = [
+            name
+            for name in models.__all__
+            if isinstance(cls := getattr(models, name), type)
+            and issubclass(cls, BaseModel)
+            and not cls.__pydantic_complete__
+        ]
+        assert incomplete == []
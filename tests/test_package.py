@@ -0,0 +1,27 @@
+"""Tests for the package namespace."""
+
+import subprocess
+import sys
+
+import pytest
+
+import firecrawl
+
+
+class TestLazyImports:
+    def test_import_does_not_load_client_or_models(self) -> None:
+        code = (
+            "import sys, firecrawl; "
+            "assert 'firecrawl.client' not in sys.modules; "
+            "assert 'firecrawl.models' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_public_names_resolve(self) -> None:
+        for name in firecrawl.__all__:
+            assert getattr(firecrawl, name) is not None
+        assert set(firecrawl.__all__) <= set(dir(firecrawl))
+
+    def test_unknown_name_raises(self) -> None:
+        with pytest.raises(AttributeError, match="no_such_thing"):
+            _ = firecrawl.no_such_thing
@@ -1,12 +1,20 @@
 """Tests for utility functions."""
 
 import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from firecrawl import load_api_key
+from firecrawl.utils import _load_api_key_from_files
+
+
+@pytest.fixture(autouse=True)
+def _clear_key_cache() -> None:
+    _load_api_key_from_files.cache_clear()
 
 
 class TestLoadApiKey:
@@ -25,6 +33,32 @@ class TestLoadApiKey:
             os.environ.pop("FIRECRAWL_API_KEY", None)
             assert load_api_key(key_file) == "fc-file-key"
 
+    def test_file_key_cached(self, tmp_path: Path) -> None:
+        key_file = tmp_path / "key.txt"
+        key_file.write_text("fc-file-key")
+        with patch.dict(os.environ, {}, clear=True):
+            assert load_api_key(key_file) == "fc-file-key"
+            key_file.unlink()
+            assert load_api_key(key_file) == "fc-file-key"
+
+    def test_default_paths_skip_directories_and_non_keys(self, tmp_path: Path) -> None:
+        secrets = tmp_path / "secrets"
+        secrets.write_text("# tokens\nGITHUB=abc\n  fc-from-secrets  \nfc-later\n")
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch("firecrawl.utils._KEY_PATHS", (tmp_path, secrets)),
+        ):
+            assert load_api_key() == "fc-from-secrets"
+
+    def test_secrets_file_instead_of_directory(self, tmp_path: Path) -> None:
+        secrets = tmp_path / ".secrets"
+        secrets.write_text("OTHER=1\nfc-abc\n")
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch("firecrawl.utils._KEY_PATHS", (secrets / "firecrawl.key", secrets)),
+        ):
+            assert load_api_key() == "fc-abc"
+
     def test_no_key_found(self, tmp_path: Path) -> None:
         with (
             patch.dict(os.environ, {}, clear=True),
@@ -33,3 +67,22 @@ class TestLoadApiKey:
             os.environ.pop("FIRECRAWL_API_KEY", None)
             with pytest.raises(ValueError, match="No API key found"):
                 load_api_key()
+
+    def test_import_without_home_directory(self) -> None:
+        # No HOME and no passwd entry for the uid, as in arbitrary-UID containers.
+        code = (
+            "import pwd\n"
+            "def no_entry(uid): raise KeyError(uid)\n"
+            "pwd.getpwuid = no_entry\n"
+            "import firecrawl\n"
+            "print(firecrawl.load_api_key())\n"
+            "import os; del os.environ['FIRECRAWL_API_KEY']\n"
+            "try: firecrawl.load_api_key()\n"
+            "except ValueError: print('no key')\n"
+        )
+        env = {k: v for k, v in os.environ.items() if k != "HOME"}
+        env["FIRECRAWL_API_KEY"] = "fc-env"
+        result = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True
+        )
+        assert result.stdout.split() == ["fc-env", "no", "key"], result.stderr